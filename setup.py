@@ -25,5 +25,7 @@ setup(
         "boto3",
         "black",
         "sqlalchemy",
+        "connectorx",
+        "pyarrow>=14",
     ],
 )
@@ -1,19 +1,25 @@
+from __future__ import annotations
+import shlex
 import subprocess
 
 
-def bash_cmd(cmd: str) -> str:
+def bash_cmd(cmd: str | list) -> str:
     """A function that will run a command line command in Python and store the output to be used later
 
+    The command is run directly, without a shell, so shell features such as pipes and redirects are not available.
 
     Parameters
     ----------
-    cmd : str
-        The command one would run in the command line
+    cmd : str or list
+        The command one would run in the command line, either as a string or as a list of arguments
 
     Returns
     -------
     str
         The output from the input in command, captured for future use"""
 
-    result = subprocess.run(cmd, shell=True, check=True, text=True, capture_output=True)
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+
+    result = subprocess.run(cmd, check=True, text=True, capture_output=True)
     return result.stdout.strip()
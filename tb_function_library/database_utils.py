@@ -1,38 +1,91 @@
 from __future__ import annotations
-import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(dir_path)
-
-import pandas as pd
-from pandas import DataFrame as DF
+import asyncio
+import io
+import time
+import uuid
 from multiprocessing.connection import Connection
+from psycopg2.errors import DuplicateTable
+from psycopg2.extras import execute_values
 from psycopg2.sql import SQL
-from connection_utils import LastpassManager, AwsDatabaseConnectionManager
-from queries_as_functions import (
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING
+from .connection_utils import (
+    LastpassManager,
+    AwsDatabaseConnectionManager,
+    PSYCOPG2_POOL_MAX_SIZE,
+)
+from .queries_as_functions import (
     row_count_query,
+    row_count_estimate_query,
     tables_in_schema_query,
+    latest_dated_table_query,
     columns_dtypes_of_table_query,
+    primary_key_query,
+    create_table_query,
+    drop_table_query,
+    copy_from_stdin_query,
+    insert_values_query,
+    copy_to_stdout_query,
     generic_sql_query,
 )
-from aws_db_details import CONFIGURED_CLUSTER_LIST
+from .aws_db_details import CONFIGURED_CLUSTER_LIST
 
 # Initiate logging
-from log_config import get_logger
+from .log_config import get_logger
+
+# pandas, pyarrow, connectorx and sqlalchemy are slow to import, so they are only imported when first used
+if TYPE_CHECKING:
+    from pandas import DataFrame as DF
 
 log = get_logger(__name__)
 
+# DataFrames of the tables in a schema, a frozenset of their names, and the time they were queried,
+# keyed by (id(conn), schema)
+_SCHEMA_TABLES_CACHE = {}
+SCHEMA_TABLES_CACHE_TTL = 60
 
-def results_to_df(conn: Connection, query_func: SQL) -> DF:
+# Runs the blocking queries behind the async helpers. Psycopg2 pools raise rather than wait
+# when they run out of connections, so there are never more workers than pooled connections.
+_ASYNC_EXECUTOR = None
+
+
+def results_to_df(
+    conn: Connection,
+    query_func: SQL,
+    uri: str = None,
+    partition_on: str = None,
+    partition_num: int = 4,
+    stream: bool = False,
+    chunk_size: int = 50_000,
+    use_copy: bool = False,
+) -> DF:
     """Returns a dataframe from SQL query results
 
+    If a ConnectorX URI is provided, the query is read in bulk with ConnectorX, which builds
+    the DataFrame column-by-column from typed buffers instead of Python tuples. Otherwise the
+    query runs through the Psycopg2 connection.
+
     Parameters
     ----------
     conn : Connection
         a database connection
     query_func: SQL
         a SQL query formatted as a Psycopg2 SQL object
+    uri : str, default None
+        a ConnectorX database URI, likely output by create_connectorx_uri()
+    partition_on : str, default None
+        a numeric column ConnectorX uses to split the query into ranges read in parallel. Requires uri.
+    partition_num : int, default 4
+        the number of partitions (and database connections) to read with when partition_on is set
+    stream : bool, default False
+        if True and no uri is provided, read the results through a server-side cursor in chunks,
+        converting each chunk to Arrow so the full result is never held as Python tuples
+    chunk_size : int, default 50,000
+        the number of rows to fetch per chunk when streaming
+    use_copy : bool, default False
+        if True and no uri is provided, read the results with COPY ... TO STDOUT (see results_to_df_via_copy)
 
 
     Returns
@@ -40,18 +93,96 @@ def results_to_df(conn: Connection, query_func: SQL) -> DF:
     DataFrame
         the output of running the input query on the input database, as a Pandas DataFrame
     """
+    if partition_on and not uri:
+        raise ValueError("A ConnectorX uri is required to partition a query")
+
+    if uri:
+        import connectorx as cx
+
+        # ConnectorX gets the query exactly as composed; prettify_query() is only for the log, since
+        # it would also rewrite multi-line string literals
+        query_string = query_func.as_string(conn)
+        log.info(f"Running Query:\n\n{prettify_query(query_string)}\n")
+
+        if partition_on:
+            return cx.read_sql(
+                uri,
+                query_string,
+                partition_on=partition_on,
+                partition_num=partition_num,
+                return_type="pandas",
+            )
+
+        return cx.read_sql(uri, query_string, return_type="pandas")
+
+    if use_copy:
+        return results_to_df_via_copy(conn, query_func)
+
+    import pandas as pd
+
+    if stream:
+        data, cols = query_table(conn, query_func, stream=True, chunk_size=chunk_size)
+        if not data:
+            return pd.DataFrame(columns=cols)
+
+        import pyarrow as pa
+
+        # Each chunk's types are inferred on their own (e.g. an all-NULL chunk is typed null,
+        # NUMERIC precision varies), so the chunks are promoted to a common schema
+        df = pa.concat_tables(data, promote_options="permissive").to_pandas(
+            self_destruct=True
+        )
+        df.columns = cols
+
+        return df
+
     data, cur = query_table(conn, query_func)
 
     # Identify column names for dataframe
-    cols = []
-    for col in cur.description:
-        cols.append(col[0])
+    cols = [col.name for col in cur.description]
+
+    if not data:
+        return pd.DataFrame(columns=cols)
 
-    df = pd.DataFrame(data=data, columns=cols)
+    # Build the DataFrame column-wise so pandas infers each column's dtype once,
+    # rather than inspecting every row tuple
+    df = pd.DataFrame(dict(enumerate(zip(*data))))
+    df.columns = cols
 
     return df
 
 
+def results_to_df_via_copy(conn: Connection, query_func: SQL) -> DF:
+    """Returns a dataframe from SQL query results, streamed as CSV with COPY ... TO STDOUT
+
+    The rows are never built into Python tuples; the CSV is parsed in bulk by PyArrow.
+    Only available on Postgres (Redshift does not support COPY TO STDOUT).
+
+    Parameters
+    ----------
+    conn : Connection
+        a Psycopg2 database connection
+    query_func: SQL
+        a SELECT query formatted as a Psycopg2 SQL object
+
+    Returns
+    -------
+    DataFrame
+        the output of running the input query on the input database, as a Pandas DataFrame
+    """
+    buffer = io.BytesIO()
+    with conn.cursor() as cur:
+        query_string = prettify_query(query_func.as_string(conn))
+        log.info(f"Running Query:\n\n{query_string}\n")
+
+        cur.copy_expert(copy_to_stdout_query(query_func).as_string(cur), buffer)
+    buffer.seek(0)
+
+    import pandas as pd
+
+    return pd.read_csv(buffer, engine="pyarrow")
+
+
 def connect_to_db_with_psycopg2_lpass(lpass_manager: LastpassManager) -> Connection:
     """A function to create a Psycopg2 database connection using a LastPass entry
 
@@ -140,7 +271,33 @@ def connect_to_db_with_sqlalchemy_nickname(
     return conn
 
 
-def columns_from_table(schema: str, table: str, conn: Connection):
+@contextmanager
+def pooled_psycopg2_connection(
+    db_manager: LastpassManager | AwsDatabaseConnectionManager | str,
+):
+    f"""A context manager that checks out a Psycopg2 database connection from a shared pool
+
+    The connection is returned to the pool, rather than closed, when the with block exits.
+
+    Parameters
+    ----------
+    db_manager : LastpassManager, AwsDatabaseConnectionManager or str
+        a connection manager, or a database nickname. Valid nicknames include: {CONFIGURED_CLUSTER_LIST}
+
+    Yields
+    -------
+    Connection
+        a Psycopg2 database connection
+    """
+    if isinstance(db_manager, str):
+        db_manager = AwsDatabaseConnectionManager(db_manager)
+
+    with db_manager.psycopg2_connection() as conn:
+        conn.autocommit = True
+        yield conn
+
+
+def columns_from_table(schema: str, table: str, conn: Connection, uri: str = None):
     """Return the column names from a table
 
     Parameters
@@ -148,18 +305,58 @@ def columns_from_table(schema: str, table: str, conn: Connection):
     schema : str
         database schema
     table: str
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
 
     Returns
     -------
     Connection
         a SQLAlchemy database connection"""
     df_columns_dtypes = results_to_df(
-        conn, columns_dtypes_of_table_query(schema, table)
+        conn, columns_dtypes_of_table_query(schema, table), uri
     )
 
     return df_columns_dtypes
 
 
+def find_partition_column(
+    schema: str, table: str, conn: Connection, uri: str = None
+) -> str:
+    """Returns the numeric primary key column of a table, to be used to partition a ConnectorX read
+
+    ConnectorX can only partition on numeric columns, so tables keyed on uuid, text, etc. are read
+    unpartitioned.
+
+    Parameters
+    ----------
+    schema : str
+        a database schema
+
+    table: str
+        the name of a table in the above schema
+
+    conn : Connection
+        a database connection
+
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
+
+    Returns
+    -------
+    str
+        the name of the primary key column, or None if the table has no single numeric primary key column
+    """
+    df_primary_key = results_to_df(conn, primary_key_query(schema, table), uri)
+
+    if len(df_primary_key.index) != 1:
+        log.info(
+            f"Could not find a single numeric primary key column on '{schema}.{table}'"
+        )
+        return None
+
+    return df_primary_key.iloc[0, 0]
+
+
 def prettify_query(ugly_query: str) -> str:
     """Format a query so it can be printed to the console
 
@@ -173,16 +370,14 @@ def prettify_query(ugly_query: str) -> str:
     str
         a SQL query, but formatted prettier so it can be printed to the console
     """
-    query_as_list = ugly_query.split("\n")
-    query_as_list = [l.strip() for l in query_as_list]
-    num_blanks = query_as_list.count("")
-    for i in range(num_blanks):
-        query_as_list.remove("")
+    stripped_lines = (line.strip() for line in ugly_query.splitlines())
 
-    return "\n".join(query_as_list)
+    return "\n".join(line for line in stripped_lines if line)
 
 
-def query_table(conn: Connection, query_func: SQL):
+def query_table(
+    conn: Connection, query_func: SQL, stream: bool = False, chunk_size: int = 50_000
+):
     """Queries a SQL table
 
     Parameters
@@ -193,23 +388,65 @@ def query_table(conn: Connection, query_func: SQL):
     query_func : SQL
         a SQL query formatted as a Psycopg2 SQL object
 
+    stream : bool, default False
+        if True, fetch the results through a server-side cursor, chunk_size rows at a time
+
+    chunk_size : int, default 50,000
+        the number of rows to fetch per chunk when streaming
+
     Returns
     -------
     data, cur
-        returns the results from the query, and the connection cursor"""
+        returns the results from the query, and the connection cursor.
+        If streaming, returns data, cols instead: a list of PyArrow Tables, one per chunk, and the
+        column names. The chunks' columns are named by position, since a query can return duplicate
+        column names, and their types are inferred per chunk, so may need promoting to concatenate.
+    """
 
-    with conn.cursor() as cur:
+    if not stream:
+        with conn.cursor() as cur:
+            query_string = prettify_query(query_func.as_string(conn))
+            log.info(f"Running Query:\n\n{query_string}\n")
+
+            cur.execute(query_func)
+            data = cur.fetchall()
+
+        return data, cur
+
+    import pyarrow as pa
+
+    # A named cursor keeps the results on the server; WITH HOLD lets it outlive the
+    # transaction on autocommit connections
+    with conn.cursor(name=f"stream_{uuid.uuid4().hex}", withhold=True) as cur:
         query_string = prettify_query(query_func.as_string(conn))
         log.info(f"Running Query:\n\n{query_string}\n")
 
+        cur.itersize = chunk_size
         cur.execute(query_func)
-        query_string = prettify_query(cur.query.decode())
-        data = cur.fetchall()
 
-    return data, cur
+        data = []
+        cols = None
+        while True:
+            batch = cur.fetchmany(chunk_size)
+
+            # Read the column names while the cursor is open; it is closed on leaving the block
+            if cols is None:
+                cols = [col.name for col in cur.description]
+                positions = [str(i) for i in range(len(cols))]
 
+            if not batch:
+                break
 
-def check_if_schema_exists(schema: str, conn: Connection) -> DF:
+            data.append(
+                pa.Table.from_arrays(
+                    [pa.array(values) for values in zip(*batch)], names=positions
+                )
+            )
+
+    return data, cols
+
+
+def check_if_schema_exists(schema: str, conn: Connection, uri: str = None) -> DF:
     """Queries the given schema and returns a DataFrame of all tables available. If schema doesn't exist, returns False
 
     Parameters
@@ -220,13 +457,16 @@ def check_if_schema_exists(schema: str, conn: Connection) -> DF:
     conn : Connection
         a database connection
 
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
+
     Returns
     -------
     DataFrame
         returns a DataFrame of all tables available in a given schema"""
 
     # Get list of tables in schema
-    df_tables_in_schema = results_to_df(conn, tables_in_schema_query(schema))
+    df_tables_in_schema = _get_tables_in_schema(conn, schema, uri)
     if df_tables_in_schema.empty:
         log.warning(f"Schema `{schema}` does not exist.")
         return False
@@ -234,9 +474,39 @@ def check_if_schema_exists(schema: str, conn: Connection) -> DF:
         return df_tables_in_schema
 
 
-def get_table_row_count(schema: str, table_name: str, conn: Connection) -> int:
+def _get_tables_in_schema(conn: Connection, schema: str, uri: str = None) -> DF:
+    """Returns a DataFrame of all tables in a schema, reusing results queried in the last SCHEMA_TABLES_CACHE_TTL seconds"""
+    key = (id(conn), schema)
+    if key in _SCHEMA_TABLES_CACHE:
+        df_tables_in_schema, _, queried_at = _SCHEMA_TABLES_CACHE[key]
+        if time.monotonic() - queried_at < SCHEMA_TABLES_CACHE_TTL:
+            return df_tables_in_schema
+
+    df_tables_in_schema = results_to_df(conn, tables_in_schema_query(schema), uri)
+    _SCHEMA_TABLES_CACHE[key] = (
+        df_tables_in_schema,
+        frozenset(df_tables_in_schema["table_name"].to_numpy().tolist()),
+        time.monotonic(),
+    )
+
+    return df_tables_in_schema
+
+
+def _clear_tables_in_schema_cache(schema: str) -> None:
+    """Drops any cached table lists for a schema, e.g. after a table is created in it"""
+    for key in [key for key in _SCHEMA_TABLES_CACHE if key[1] == schema]:
+        del _SCHEMA_TABLES_CACHE[key]
+
+
+def get_table_row_count(
+    schema: str, table_name: str, conn: Connection, uri: str = None, exact: bool = False
+) -> int:
     """Returns the row count for a given table
 
+    By default this is Postgres' estimate from pg_class, which is a catalog lookup rather than
+    a full scan of the table. Tables with no positive estimate (never analyzed, or empty) fall back
+    to an exact count.
+
     Parameters
     ----------
     schema : str
@@ -248,17 +518,38 @@ def get_table_row_count(schema: str, table_name: str, conn: Connection) -> int:
     conn : Connection
         a database connection
 
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
+
+    exact : bool, default False
+        whether to run a full count(*) of the table instead of using the estimate
+
     Returns
     -------
     int
         row count for the table"""
 
-    df_count = results_to_df(conn, row_count_query(schema, table_name))
+    if not exact:
+        df_estimate = results_to_df(
+            conn, row_count_estimate_query(schema, table_name), uri
+        )
+        # Never-analyzed tables have an estimate of -1 (Postgres 14+) or 0 (older Postgres,
+        # Redshift), so only a positive estimate is trusted
+        if not df_estimate.empty and df_estimate.iloc[0, 0] > 0:
+            return int(df_estimate.iloc[0, 0])
+
+        log.info(
+            f"No row count estimate for {schema}.{table_name}, running an exact count"
+        )
+
+    df_count = results_to_df(conn, row_count_query(schema, table_name), uri)
 
     return df_count.iloc[0, 0]
 
 
-def check_if_table_exists(schema: str, table_name: str, df_tables_in_schema: DF) -> str:
+def check_if_table_exists(
+    schema: str, table_name: str, df_tables_in_schema: DF | set
+) -> str:
     """Returns a table name to query based on the inputs. If the base name exists as a table, it will return that.
 
     Parameters
@@ -269,17 +560,22 @@ def check_if_table_exists(schema: str, table_name: str, df_tables_in_schema: DF)
     table_name: str
         the name of a table in the above schema
 
-    df_tables_in_schema : DataFrame
-        a DataFrame of all the tables available in the Schema, likely output by check_if_schema_exists()
+    df_tables_in_schema : DataFrame or set
+        a DataFrame of all the tables available in the Schema, likely output by check_if_schema_exists(),
+        or a set of their names. When checking many tables, build the set once with tables_in_schema_set().
 
     Returns
     -------
     str
         if the table exists in the schema, it returns the table name, else returns False
     """
+    if isinstance(df_tables_in_schema, (set, frozenset)):
+        tables_in_schema = df_tables_in_schema
+    else:
+        tables_in_schema = tables_in_schema_set(df_tables_in_schema)
 
     # Does the table as written exist in the schema?
-    if (df_tables_in_schema["table_name"] == table_name).any():
+    if table_name in tables_in_schema:
         log.info(f"Found '{table_name}' in the '{schema}' schema")
 
         return table_name
@@ -291,18 +587,125 @@ def check_if_table_exists(schema: str, table_name: str, df_tables_in_schema: DF)
         return False
 
 
+def tables_in_schema_set(df_tables_in_schema: DF) -> frozenset:
+    """Returns the table names from a DataFrame of tables as a set, for fast membership checks
+
+    If the DataFrame came from check_if_schema_exists(), the set built when it was cached is reused.
+
+    Parameters
+    ----------
+    df_tables_in_schema : DataFrame
+        a DataFrame of all the tables available in the Schema, likely output by check_if_schema_exists()
+
+    Returns
+    -------
+    frozenset
+        the names of the tables in the schema
+    """
+    for cached_df, tables_in_schema, _ in _SCHEMA_TABLES_CACHE.values():
+        if cached_df is df_tables_in_schema:
+            return tables_in_schema
+
+    return frozenset(df_tables_in_schema["table_name"].to_numpy().tolist())
+
+
+def postgres_dtypes_from_df(df: DF) -> dict:
+    """Maps the columns of a DataFrame to Postgres data types
+
+    Parameters
+    ----------
+    df : DataFrame
+        a DataFrame to be loaded into a database
+
+    Returns
+    -------
+    dict
+        a dictionary of column names and their Postgres data types
+    """
+    import pandas as pd
+
+    columns_dtypes = {}
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            columns_dtypes[column] = "BOOLEAN"
+        elif pd.api.types.is_integer_dtype(dtype):
+            columns_dtypes[column] = "BIGINT"
+        elif pd.api.types.is_float_dtype(dtype):
+            columns_dtypes[column] = "DOUBLE PRECISION"
+        elif isinstance(dtype, pd.DatetimeTZDtype):
+            # The CSV carries a UTC offset, which TIMESTAMP (without time zone) would discard
+            columns_dtypes[column] = "TIMESTAMPTZ"
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            columns_dtypes[column] = "TIMESTAMP"
+        else:
+            columns_dtypes[column] = "TEXT"
+
+    return columns_dtypes
+
+
+def df_to_csv_buffer(df: DF) -> io.BytesIO:
+    """Serializes a DataFrame to an in-memory CSV, without a header, for COPY FROM STDIN
+
+    The CSV is written by PyArrow's multi-threaded writer. Columns PyArrow cannot convert
+    (e.g. mixed-type object columns) fall back to pandas' writer.
+
+    Parameters
+    ----------
+    df : DataFrame
+        a DataFrame to be loaded into a database
+
+    Returns
+    -------
+    BytesIO
+        the CSV data, positioned at the start of the buffer
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    buffer = io.BytesIO()
+    try:
+        pa_csv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            buffer,
+            write_options=pa_csv.WriteOptions(include_header=False),
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, header=False, encoding="utf-8")
+    buffer.seek(0)
+
+    return buffer
+
+
+def _is_redshift(conn: Connection) -> bool:
+    """Returns whether a Psycopg2 connection is to Redshift, which has no COPY FROM STDIN"""
+    with conn.cursor() as cur:
+        cur.execute("SELECT version()")
+        return "Redshift" in cur.fetchone()[0]
+
+
 def insert_df_to_db(
-    df: DF, conn: Connection, schema: str, table_name: str, if_exists: str = "fail"
+    df: DF,
+    conn: Connection,
+    schema: str,
+    table_name: str,
+    if_exists: str = "fail",
+    method: str = None,
+    page_size: int = 1000,
 ):
     """Used to create a new table and insert data into it.
 
+    By default the data is streamed to the database with a single COPY FROM STDIN, rather than
+    row-by-row INSERTs. Redshift does not support COPY FROM STDIN, so on Redshift the default is
+    batched INSERTs ('values') instead.
+
     Parameters
     ----------
     df : DataFrame
         a database schema
 
     conn : Connection
-        a database connection
+        a Psycopg2 or SQLAlchemy database connection
 
     schema : str
         a database schema
@@ -317,19 +720,99 @@ def insert_df_to_db(
         - replace: Drop the table before inserting new values.
         - append: Insert new values to the existing table.
 
+    method : {'copy', 'values', 'to_sql'}, default: 'copy', or 'values' on Redshift
+        How to load the data.
+        - copy: Stream the data as CSV with COPY FROM STDIN. Not available on Redshift.
+        - values: Batch page_size rows into each INSERT with psycopg2's execute_values,
+          for when COPY is not available.
+        - to_sql: Use pandas' DataFrame.to_sql. Requires a SQLAlchemy connection.
+
+    page_size : int, default: 1000
+        The number of rows per INSERT statement when method is 'values'
+
 
     Returns
     -------
     int
         The number of rows inserted into the table
     """
+    if if_exists not in ("fail", "replace", "append"):
+        raise ValueError(f"'{if_exists}' is not valid for if_exists")
+    if method not in (None, "copy", "values", "to_sql"):
+        raise ValueError(f"'{method}' is not valid for method")
+
+    from sqlalchemy.engine import Connection as SqlAlchemyConnection
+
+    # COPY and execute_values are only available on the raw Psycopg2 connection
+    if isinstance(conn, SqlAlchemyConnection):
+        raw_conn = conn.connection
+    else:
+        raw_conn = conn
+
+    if method is None:
+        method = "values" if _is_redshift(raw_conn) else "copy"
+
     log.info(f"Load to '{table_name}' starting...")
-    result = df.to_sql(table_name, conn, schema, if_exists=if_exists, index=False)
+
+    if method == "to_sql":
+        result = df.to_sql(table_name, conn, schema, if_exists=if_exists, index=False)
+        _clear_tables_in_schema_cache(schema)
+        log.info(f"Load to '{table_name}' COMPLETE!!!")
+        return result
+
+    columns_dtypes = postgres_dtypes_from_df(df)
+    with raw_conn.cursor() as cur:
+        if if_exists == "replace":
+            cur.execute(drop_table_query(schema, table_name))
+
+        try:
+            cur.execute(
+                create_table_query(
+                    schema,
+                    table_name,
+                    columns_dtypes,
+                    if_not_exists=(if_exists == "append"),
+                )
+            )
+        except DuplicateTable:
+            raw_conn.rollback()
+            raise ValueError(f"Table '{schema}.{table_name}' already exists.")
+
+        if method == "copy":
+            buffer = df_to_csv_buffer(df)
+
+            cur.copy_expert(
+                copy_from_stdin_query(schema, table_name, list(df.columns)).as_string(
+                    cur
+                ),
+                buffer,
+            )
+        else:
+            # Convert NumPy scalars to Python objects (and NaN to NULL) so psycopg2 can adapt them
+            rows = list(
+                df.astype(object)
+                .where(df.notna(), None)
+                .itertuples(index=False, name=None)
+            )
+            execute_values(
+                cur,
+                insert_values_query(schema, table_name, list(df.columns)).as_string(
+                    cur
+                ),
+                rows,
+                page_size=page_size,
+            )
+    raw_conn.commit()
+
+    _clear_tables_in_schema_cache(schema)
+
     log.info(f"Load to '{table_name}' COMPLETE!!!")
-    return result
+    return len(df.index)
 
 
-def find_table_to_query(schema: str, base_table_name: str, conn: Connection) -> str:
+def find_table_to_query(
+    schema: str, base_table_name: str, conn: Connection, uri: str = None
+) -> str:
     """Returns a table name to query based on the inputs.
 
     If the base name exists as a table, it will return that.
@@ -347,47 +830,36 @@ def find_table_to_query(schema: str, base_table_name: str, conn: Connection) ->
     conn : Connection
         a database connection
 
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
+
     Returns
     -------
     str
         most-recent table that matches the input base_table_name
     """
 
-    # Get list of tables in schema
-    df_tables_in_schema = results_to_df(conn, tables_in_schema_query(schema))
-
-    if df_tables_in_schema.empty:
-        raise ValueError(f"Could not find the schema '{schema}'")
-    table_to_query = False
     # Does the table as written exist in the schema (i.e. w/o a date appended)?
-    if (df_tables_in_schema["table_name"] == base_table_name).any():
-        table_to_query = base_table_name
-        log.info(f"Found {table_to_query} in the database")
+    # If not, assume dated tables get generated daily and take the table with the largest
+    # table name that matches the base pattern (i.e most recent)
+    df_table_to_query = results_to_df(
+        conn, latest_dated_table_query(schema, base_table_name), uri
+    )
 
-        return table_to_query
-    else:
-        # If the base table name doesn't exist, assume dated tables get generated daily
-        # and retrieve the table with the largest table name that matches base pattern (i.e most recent)
-        filter_pattern = "^" + base_table_name + "_" + "\d{8}"
-        table_to_query = (
-            df_tables_in_schema[
-                df_tables_in_schema["table_name"].str.contains(
-                    filter_pattern, regex=True
-                )
-            ]
-            .max()
-            .values[0]
+    if df_table_to_query.empty:
+        raise ValueError(
+            f"Could not find a table matching the pattern '{base_table_name}' in the schema '{schema}'"
         )
 
-        if type(table_to_query) != str and math.isnan(table_to_query):
-            raise ValueError(
-                f"Could not find a table matching the pattern '{base_table_name}'"
-            )
-
+    table_to_query = df_table_to_query.iloc[0, 0]
+    if table_to_query == base_table_name:
+        log.info(f"Found {table_to_query} in the database")
+    else:
         log.info(
             f'Found "{table_to_query}" as the newest table matching "{base_table_name}"'
         )
-        return table_to_query
+
+    return table_to_query
 
 
 def query_into_df(
@@ -397,6 +869,12 @@ def query_into_df(
     clause: str = None,
     limit: int = False,
     random: bool = False,
+    uri: str = None,
+    partition_on: str = None,
+    partition_num: int = 4,
+    stream: bool = False,
+    chunk_size: int = 50_000,
+    use_copy: bool = False,
 ) -> DF:
     """
     Basic function to query BEDAP and return all columns.
@@ -422,17 +900,39 @@ def query_into_df(
         SQL LIMIT
     random : bool {True, False}, default False
         if you want a pseudo-random result
+    uri : str, default None
+        a ConnectorX database URI, used for a bulk read when provided
+    partition_on : str, default None
+        a numeric column to split the read into parallel range queries. Use "auto" to partition on
+        the table's primary key. Requires uri.
+    partition_num : int, default 4
+        the number of partitions to read in parallel when partition_on is set
+    stream : bool, default False
+        if True and no uri is provided, fetch the results in chunks through a server-side cursor,
+        which keeps peak memory down on large tables
+    chunk_size : int, default 50,000
+        the number of rows to fetch per chunk when streaming
+    use_copy : bool, default False
+        if True and no uri is provided, read the results with COPY ... TO STDOUT instead of a cursor
 
     Returns
     -------
     DataFrame
         DataFrame of query results
     """
+    if partition_on == "auto":
+        partition_on = find_partition_column(schema, table, conn, uri)
 
     # Query table and return df
     df_query_results = results_to_df(
         conn,
         generic_sql_query(schema, table, clause, limit=limit, random=random),
+        uri,
+        partition_on=partition_on,
+        partition_num=partition_num,
+        stream=stream,
+        chunk_size=chunk_size,
+        use_copy=use_copy,
     )
 
     num_results = len(df_query_results.index)
@@ -447,3 +947,54 @@ def query_into_df(
             log.info(f"Results:\n{df_query_results}")
 
     return df_query_results
+
+
+def _pooled_query_into_df(
+    schema: str,
+    table: str,
+    db_manager: LastpassManager | AwsDatabaseConnectionManager | str,
+    kwargs: dict,
+) -> DF:
+    with pooled_psycopg2_connection(db_manager) as conn:
+        return query_into_df(schema, table, conn, **kwargs)
+
+
+async def aquery_into_df(
+    schema: str,
+    table: str,
+    db_manager: LastpassManager | AwsDatabaseConnectionManager | str,
+    **kwargs,
+) -> DF:
+    f"""Asynchronous version of query_into_df, for running several queries at once
+
+    Each call checks out its own pooled connection and runs the query in a worker thread, so
+    independent queries can be awaited together with asyncio.gather().
+
+    Parameters
+    ----------
+    schema : str
+        a database schema
+
+    table: str
+        the name of a table to query in the above schema
+
+    db_manager : LastpassManager, AwsDatabaseConnectionManager or str
+        a connection manager, or a database nickname. Valid nicknames include: {CONFIGURED_CLUSTER_LIST}
+
+    **kwargs
+        any other arguments accepted by query_into_df (clause, limit, random, etc.)
+
+    Returns
+    -------
+    DataFrame
+        DataFrame of query results
+    """
+    global _ASYNC_EXECUTOR
+    if _ASYNC_EXECUTOR is None:
+        _ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=PSYCOPG2_POOL_MAX_SIZE)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _ASYNC_EXECUTOR,
+        partial(_pooled_query_into_df, schema, table, db_manager, kwargs),
+    )
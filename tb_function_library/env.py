@@ -0,0 +1,14 @@
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    """A function to load the environmental file once per process
+
+    Returns
+    -------
+    bool
+        True if a .env file was found and loaded, else False
+    """
+    return load_dotenv()
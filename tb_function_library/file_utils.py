@@ -1,23 +1,48 @@
 from __future__ import annotations
 import os
-import sys
-import pandas as pd
+from typing import TYPE_CHECKING
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(dir_path)
-
-import os
-from pandas import DataFrame as DF
+if TYPE_CHECKING:
+    from pandas import DataFrame as DF
 
 # Initiate logging
-from log_config import get_logger
+from .log_config import get_logger
 
 log = get_logger(__name__)
 
-
-def results_to_csv(df: DF, csv_name: str, results_folder: str = "./results/") -> None:
+# Suffixes pandas infers CSV compression from, longest first so '.tar.gz' wins over '.gz'
+_CSV_COMPRESSION_SUFFIXES = (
+    (".tar.gz", "tar"),
+    (".tar.bz2", "tar"),
+    (".tar.xz", "tar"),
+    (".tar", "tar"),
+    (".gz", "gzip"),
+    (".bz2", "bz2"),
+    (".zip", "zip"),
+    (".xz", "xz"),
+    (".zst", "zstd"),
+)
+# Codecs PyArrow can stream a CSV through; anything else (zip, xz, tar, dict options) is written by pandas
+_ARROW_CSV_CODECS = ("gzip", "bz2", "zstd")
+
+
+def results_to_csv(
+    df: DF,
+    csv_name: str,
+    results_folder: str = "./results/",
+    compression: str = None,
+    file_format: str = "csv",
+) -> None:
     """Store a DataFrameto a CSV in a defined folder.
 
+    The file is written with PyArrow, which serializes whole columns at a time rather than
+    formatting row-by-row in Python. DataFrames PyArrow cannot convert, and compression codecs
+    PyArrow cannot stream (e.g. 'zip', 'xz'), are written by pandas instead.
+
+    PyArrow's CSV output differs from pandas' ``to_csv``: header names are quoted, booleans are
+    written as ``true``/``false`` and timestamps carry microseconds (``2024-01-01 00:00:00.000000``).
+    Consumers that parse the file by exact text should expect this format.
+
     Parameters
     ----------
     df : DataFrame
@@ -29,14 +54,127 @@ def results_to_csv(df: DF, csv_name: str, results_folder: str = "./results/") ->
     results_folder : str, default: './results/'
         The folder in which you would like to store the CSV
 
+    compression : str, default: None
+        Compression codec for the CSV (e.g. 'gzip'), or for the Parquet file when
+        file_format is 'parquet' (defaults to 'zstd'). For CSVs it is inferred from the file
+        extension ('.gz', '.bz2', '.zip', '.xz', '.zst', '.tar') when not given, as pandas does.
+
+    file_format : {'csv', 'parquet'}, default: 'csv'
+        The format to write. Parquet files are columnar, compressed, and keep the DataFrame's dtypes.
+
     Returns
     -------
         None
     """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"'{file_format}' is not a valid file_format")
+
+    if file_format == "parquet":
+        results_to_parquet(
+            df, csv_name, results_folder, compression=compression or "zstd"
+        )
+        return
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
     make_dir_if_not_exists(results_folder)
 
     file = results_folder + csv_name
-    df.to_csv(file, index=False)
+
+    if compression is None or compression == "infer":
+        compression = next(
+            (
+                codec
+                for suffix, codec in _CSV_COMPRESSION_SUFFIXES
+                if file.lower().endswith(suffix)
+            ),
+            None,
+        )
+
+    if compression is not None and compression not in _ARROW_CSV_CODECS:
+        df.to_csv(file, index=False, compression=compression)
+        return
+
+    # Columns PyArrow cannot convert (e.g. mixed-type objects, UUIDs, jsonb dicts) fall back to pandas' writer
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        df.to_csv(file, index=False, compression=compression)
+        return
+
+    if compression:
+        with pa.CompressedOutputStream(file, compression) as stream:
+            pa_csv.write_csv(table, stream)
+    else:
+        pa_csv.write_csv(table, file)
+
+
+def results_to_parquet(
+    df: DF,
+    parquet_name: str,
+    results_folder: str = "./results/",
+    compression: str = "zstd",
+    row_group_size: int = None,
+) -> None:
+    """Store a DataFrame to a Parquet file in a defined folder.
+
+    Parameters
+    ----------
+    df : DataFrame
+        a DataFrame of query results
+
+    parquet_name : str
+        The name you would like the results Parquet file to be called
+
+    results_folder : str, default: './results/'
+        The folder in which you would like to store the Parquet file
+
+    compression : str, default: 'zstd'
+        Compression codec for the Parquet file
+
+    row_group_size : int, default: None
+        Maximum number of rows in each row group. Defaults to PyArrow's row group size.
+
+    Returns
+    -------
+        None
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    make_dir_if_not_exists(results_folder)
+
+    file = results_folder + parquet_name
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        file,
+        compression=compression,
+        row_group_size=row_group_size,
+        use_dictionary=True,
+    )
+
+
+def parquet_to_df(file_path: str, columns: list = None) -> DF:
+    """Read a Parquet file into a DataFrame.
+
+    Parameters
+    ----------
+    file_path : str
+        the path to the Parquet file
+
+    columns : list, default: None
+        Only read these columns. Columns that are not requested are never read from disk.
+
+    Returns
+    -------
+    DataFrame
+        the contents of the Parquet file
+    """
+    import pyarrow.parquet as pq
+
+    return pq.read_table(file_path, columns=columns, use_threads=True).to_pandas()
 
 
 def check_if_file_exists(directory: str, filename: str):
@@ -63,14 +201,15 @@ def check_if_file_exists(directory: str, filename: str):
 
     file_path = directory + filename
 
-    if os.path.exists(directory):
-        if os.path.exists(file_path):
-            return file_path
-        else:
+    # A single stat on the hit path; the directory is only checked to word the warning
+    try:
+        os.stat(file_path)
+        return file_path
+    except OSError:
+        if os.path.isdir(directory or "."):
             log.warning(f"`\n{filename}` does not exist in {directory}.\n")
-            return False
-    else:
-        log.warning(f"\n{directory} does not exist.\n")
+        else:
+            log.warning(f"\n{directory} does not exist.\n")
         return False
 
 
@@ -126,6 +265,4 @@ def make_dir_if_not_exists(folder: str) -> None:
     -------
     None
     """
-    if not os.path.exists(folder):
-        # If folder doesn't exist, create it.
-        os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
@@ -1,17 +1,11 @@
-import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(dir_path)
-
 import logging
 from logging import Logger
 import os
 from logging.config import dictConfig
-from dotenv import load_dotenv
+from .env import load_env
 
-load_dotenv()
-CPT_LOGGERS = [os.environ.get("CPT_LOGGERS")]
+load_env()
+CPT_LOGGERS = [logger for logger in [os.environ.get("CPT_LOGGERS")] if logger]
 
 LOGGER_DEFAULTS = {"handlers": ["console"], "level": "INFO", "propagate": False}
 
@@ -35,6 +29,9 @@ LOGGING_CONFIG = {
     },
 }
 
+# dictConfig only needs to run once per interpreter, not once per logger
+_CONFIGURED = False
+
 
 def get_logger(name: str) -> Logger:
     """A function to instantiate a logger
@@ -49,7 +46,11 @@ def get_logger(name: str) -> Logger:
     Logger
         A logger object
     """
-    dictConfig(LOGGING_CONFIG)
+    global _CONFIGURED
+    if not _CONFIGURED:
+        dictConfig(LOGGING_CONFIG)
+        _CONFIGURED = True
+
     log = logging.getLogger(name)
 
     return log
@@ -1,9 +1,42 @@
+from __future__ import annotations
+import re
+from string import Formatter
 from psycopg2 import sql
 from psycopg2.sql import SQL
 
 # TODO: Implement Query Class!!
 
 
+def compile_query_template(query_template: str) -> list:
+    """A function to split a query template into SQL text and placeholder names, once
+
+    The static templates below are compiled at import, so building a query only fills in
+    parameters rather than re-parsing the template string on every call.
+
+    Parameters
+    ----------
+    query_template : str
+        a query template with named placeholder values
+
+    Returns
+    -------
+    list
+        (SQL text or None, placeholder name or None) pairs, to be passed to params_in_query_template()
+    """
+    return [
+        (SQL(literal) if literal else None, placeholder)
+        for literal, placeholder, _, _ in Formatter().parse(query_template)
+    ]
+
+
+_TABLES_IN_SCHEMA_TEMPLATE = compile_query_template("""
+        SELECT table_name,
+            CASE WHEN table_type = 'VIEW' THEN 'VIEW' ELSE 'TABLE' END as table_or_view
+        FROM information_schema.tables
+        WHERE table_schema = {schema} AND table_type IN ('BASE TABLE', 'VIEW')
+        """)
+
+
 def tables_in_schema_query(schema: str) -> SQL:
     """Query to identify tables in the schema provided
 
@@ -18,22 +51,59 @@ def tables_in_schema_query(schema: str) -> SQL:
         Returns formatted Psycopg2 SQL object
     """
 
-    query_template = """
-        SELECT table_name,'TABLE' as table_or_view
+    params = {"schema": sql.Literal(schema)}
+
+    query = params_in_query_template(_TABLES_IN_SCHEMA_TEMPLATE, params)
+    return query
+
+
+_LATEST_DATED_TABLE_TEMPLATE = compile_query_template("""
+        SELECT table_name
         FROM information_schema.tables
-        WHERE table_schema = {schema} AND table_type='BASE TABLE'
-        UNION
-        SELECT table_name,'VIEW' as table_or_view
-        FROM information_schema.views
         WHERE table_schema = {schema}
-        """
+            AND (table_name = {base_table_name} OR table_name ~ {pattern})
+        ORDER BY table_name = {base_table_name} DESC, table_name DESC
+        LIMIT 1
+        """)
 
-    params = {"schema": sql.Literal(schema)}
 
-    query = params_in_query_template(query_template, params)
+def latest_dated_table_query(schema: str, base_table_name: str) -> SQL:
+    """Query to find the table to query for a base table name in the schema provided
+
+    Returns the base table itself if it exists, otherwise the most recent dated
+    table (base_table_name_YYYYMMDD), as a single row.
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    base_table_name : str
+        a table name, with any date suffixes removed
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object
+    """
+
+    params = {
+        "schema": sql.Literal(schema),
+        "base_table_name": sql.Literal(base_table_name),
+        "pattern": sql.Literal("^" + re.escape(base_table_name) + "_[0-9]{8}$"),
+    }
+
+    query = params_in_query_template(_LATEST_DATED_TABLE_TEMPLATE, params)
     return query
 
 
+_COLUMNS_DTYPES_OF_TABLE_TEMPLATE = compile_query_template("""
+        SELECT c.column_name, c.udt_name as dtype
+        FROM information_schema.columns c
+        WHERE c.table_schema = {schema} AND c.table_name = {table}
+    """)
+
+
 def columns_dtypes_of_table_query(schema: str, table: str) -> SQL:
     """Query to get a list of columns and data types from the table specified
 
@@ -50,22 +120,39 @@ def columns_dtypes_of_table_query(schema: str, table: str) -> SQL:
     SQL
         Returns formatted Psycopg2 SQL object"""
 
-    query_template = """
-        SELECT c.column_name, c.udt_name as dtype
-        FROM information_schema.columns c
-        WHERE c.table_schema = {schema} AND c.table_name = {table}
-    """
     params = {
         "schema": sql.Literal(schema),
         "table": sql.Literal(table),
     }
 
-    query = params_in_query_template(query_template, params)
+    query = params_in_query_template(_COLUMNS_DTYPES_OF_TABLE_TEMPLATE, params)
     return query
 
 
-def row_count_query(schema: str, table: str) -> SQL:
-    """Query to get the row count of a tbale
+_PRIMARY_KEY_TEMPLATE = compile_query_template("""
+        SELECT kcu.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu
+            ON tc.constraint_name = kcu.constraint_name
+            AND tc.table_schema = kcu.table_schema
+            AND tc.table_name = kcu.table_name
+        JOIN information_schema.columns c
+            ON c.table_schema = kcu.table_schema
+            AND c.table_name = kcu.table_name
+            AND c.column_name = kcu.column_name
+        WHERE tc.constraint_type = 'PRIMARY KEY'
+            AND tc.table_schema = {schema} AND tc.table_name = {table}
+            AND c.data_type IN (
+                'smallint', 'integer', 'bigint', 'numeric', 'decimal', 'real', 'double precision'
+            )
+        ORDER BY kcu.ordinal_position
+    """)
+
+
+def primary_key_query(schema: str, table: str) -> SQL:
+    """Query to get the numeric primary key column(s) of a table, i.e. the ones ConnectorX can partition on
+
+    Primary key columns of other types (uuid, text, etc.) are left out.
 
     Parameters
     ----------
@@ -80,19 +167,256 @@ def row_count_query(schema: str, table: str) -> SQL:
     SQL
         Returns formatted Psycopg2 SQL object"""
 
-    query_template = """
+    params = {
+        "schema": sql.Literal(schema),
+        "table": sql.Literal(table),
+    }
+
+    query = params_in_query_template(_PRIMARY_KEY_TEMPLATE, params)
+    return query
+
+
+_ROW_COUNT_TEMPLATE = compile_query_template("""
     SELECT count(*)
     FROM {schema}.{table}
+    """)
+
+
+def row_count_query(schema: str, table: str) -> SQL:
+    """Query to get the row count of a tbale
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {
+        "schema": sql.Identifier(schema),
+        "table": sql.Identifier(table),
+    }
+
+    query = params_in_query_template(_ROW_COUNT_TEMPLATE, params)
+    return query
+
+
+_ROW_COUNT_ESTIMATE_TEMPLATE = compile_query_template("""
+    SELECT c.reltuples::bigint
+    FROM pg_class c
+    JOIN pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = {schema} AND c.relname = {table}
+    """)
+
+
+def row_count_estimate_query(schema: str, table: str) -> SQL:
+    """Query to get the planner's estimated row count of a table from pg_class
+
+    This is a catalog lookup rather than a table scan, so it is only as fresh as the last
+    VACUUM / ANALYZE of the table. A table that has never been analyzed has an estimate of -1 on
+    Postgres 14+, and 0 on older Postgres versions and Redshift.
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {
+        "schema": sql.Literal(schema),
+        "table": sql.Literal(table),
+    }
+
+    query = params_in_query_template(_ROW_COUNT_ESTIMATE_TEMPLATE, params)
+    return query
+
+
+_CREATE_TABLE_TEMPLATE = compile_query_template("""
+        CREATE TABLE {if_not_exists}{schema}.{table} ({columns})
+    """)
+
+
+def create_table_query(
+    schema: str, table: str, columns_dtypes: dict, if_not_exists: bool = False
+) -> SQL:
+    """Query to create a table with the columns and data types provided
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    columns_dtypes : dict
+        a dictionary of column names and their Postgres data types, e.g. {"id": "BIGINT"}
+
+    if_not_exists : bool (optional), default = False
+        whether to skip creating the table if it already exists
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {
+        "if_not_exists": SQL("IF NOT EXISTS " if if_not_exists else ""),
+        "schema": sql.Identifier(schema),
+        "table": sql.Identifier(table),
+        "columns": SQL(", ").join(
+            SQL("{} {}").format(sql.Identifier(str(column)), SQL(dtype))
+            for column, dtype in columns_dtypes.items()
+        ),
+    }
+
+    query = params_in_query_template(_CREATE_TABLE_TEMPLATE, params)
+    return query
+
+
+_DROP_TABLE_TEMPLATE = compile_query_template("""
+        DROP TABLE IF EXISTS {schema}.{table}
+    """)
+
+
+def drop_table_query(schema: str, table: str) -> SQL:
+    """Query to drop a table, if it exists
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {
+        "schema": sql.Identifier(schema),
+        "table": sql.Identifier(table),
+    }
+
+    query = params_in_query_template(_DROP_TABLE_TEMPLATE, params)
+    return query
+
+
+_COPY_FROM_STDIN_TEMPLATE = compile_query_template("""
+        COPY {schema}.{table} ({columns}) FROM STDIN WITH CSV
+    """)
+
+
+def copy_from_stdin_query(schema: str, table: str, columns: list) -> SQL:
+    """Query to bulk load CSV data from STDIN into a table with COPY
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    columns : list
+        the columns, in the order they appear in the CSV data
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {
+        "schema": sql.Identifier(schema),
+        "table": sql.Identifier(table),
+        "columns": SQL(", ").join(sql.Identifier(str(column)) for column in columns),
+    }
+
+    query = params_in_query_template(_COPY_FROM_STDIN_TEMPLATE, params)
+    return query
+
+
+_INSERT_VALUES_TEMPLATE = compile_query_template("""
+        INSERT INTO {schema}.{table} ({columns}) VALUES %s
+    """)
+
+
+def insert_values_query(schema: str, table: str, columns: list) -> SQL:
+    """Query to insert rows into a table with psycopg2.extras.execute_values
+
+    Parameters
+    ----------
+    schema : str
+        a schema
+
+    table : str
+        a table name
+
+    columns : list
+        the columns, in the order they appear in each row
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object, with a single %s placeholder for the rows
     """
+
     params = {
         "schema": sql.Identifier(schema),
         "table": sql.Identifier(table),
+        "columns": SQL(", ").join(sql.Identifier(str(column)) for column in columns),
     }
 
-    query = params_in_query_template(query_template, params)
+    query = params_in_query_template(_INSERT_VALUES_TEMPLATE, params)
+    return query
+
+
+_COPY_TO_STDOUT_TEMPLATE = compile_query_template("""
+        COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER TRUE)
+    """)
+
+
+def copy_to_stdout_query(query: SQL) -> SQL:
+    """Query to stream the results of another query as CSV, with a header row, using COPY
+
+    Parameters
+    ----------
+    query : SQL
+        a SELECT query formatted as a Psycopg2 SQL object
+
+    Returns
+    -------
+    SQL
+        Returns formatted Psycopg2 SQL object"""
+
+    params = {"query": query}
+
+    query = params_in_query_template(_COPY_TO_STDOUT_TEMPLATE, params)
     return query
 
 
+_GENERIC_SQL_TEMPLATE = compile_query_template("""
+        SELECT *
+        FROM {schema}.{table}
+        """)
+_LIMIT_TEMPLATE = compile_query_template("\nLIMIT {limit}")
+
+
 def generic_sql_query(
     schema: str,
     table: str,
@@ -124,38 +448,36 @@ def generic_sql_query(
     SQL
         Returns formatted Psycopg2 SQL object
     """
-    query_template = """
-        SELECT *
-        FROM {schema}.{table}
-        """
     params = {
         "schema": sql.Identifier(schema),
         "table": sql.Identifier(table),
     }
+    query = params_in_query_template(_GENERIC_SQL_TEMPLATE, params)
 
+    # The clause is appended as-is, rather than parsed as part of the template
     if clause:
-        query_template = query_template + "\n" + clause
+        query += SQL("\n" + clause)
         if random:
-            query_template = query_template + " AND RANDOM() < 0.1"
+            query += SQL(" AND RANDOM() < 0.1")
     else:
         if random:
-            query_template = query_template + "\nWHERE RANDOM() < 0.1"
+            query += SQL("\nWHERE RANDOM() < 0.1")
 
     if limit:
-        query_template = query_template + "\nLIMIT {limit}"
-        params["limit"] = sql.Literal(limit)
+        query += params_in_query_template(
+            _LIMIT_TEMPLATE, {"limit": sql.Literal(limit)}
+        )
 
-    query = params_in_query_template(query_template, params)
     return query
 
 
-def params_in_query_template(query_template: str, params: dict) -> SQL:
+def params_in_query_template(query_template: str | list, params: dict) -> SQL:
     """A function to insert parameters into query template
 
     Parameters
     ----------
-    query_template : str
-        a query template with placeholder values
+    query_template : str or list
+        a query template with placeholder values, or a template already split by compile_query_template()
 
     params : dict
         a dictionary of parameters to be inserted into the query template
@@ -165,4 +487,14 @@ def params_in_query_template(query_template: str, params: dict) -> SQL:
     SQL
         Returns formatted Psycopg2 SQL object
     """
-    return SQL(query_template).format(**params)
+    if isinstance(query_template, str):
+        return SQL(query_template).format(**params)
+
+    parts = []
+    for literal, placeholder in query_template:
+        if literal is not None:
+            parts.append(literal)
+        if placeholder is not None:
+            parts.append(params[placeholder])
+
+    return sql.Composed(parts)
@@ -1,12 +1,13 @@
+from __future__ import annotations
+import hashlib
 import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(dir_path)
-
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 from botocore.exceptions import ClientError
+from boto3.exceptions import S3UploadFailedError
 from boto3.resources.factory import ServiceResource
-from file_utils import (
+from boto3.s3.transfer import TransferConfig
+from .file_utils import (
     ensure_file_slash,
     filename_is_blank,
     check_if_file_exists,
@@ -14,20 +15,135 @@ from file_utils import (
 )
 
 # Initiate logging
-from log_config import get_logger
+from .log_config import get_logger
 
 log = get_logger(__name__)
 
+# Default download folder for pull_file_from_s3(), resolved once rather than on every call
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Multipart settings for single uploads and downloads: files over 8 MB are split into 16 MB
+# byte ranges, 32 in flight, since a single S3 stream tops out well below most links
+DEFAULT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=32,
+    use_threads=True,
+)
+# Files smaller than this are uploaded with one PutObject call instead of upload_file()
+SINGLE_PUT_THRESHOLD = 5 * 1024 * 1024
+# For batches of uploads and downloads, where the files themselves run in parallel: 16 files x 4 parts
+# in flight matches the 64 connections in connection_utils.BOTO_CONFIG
+BATCH_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+def get_s3_client(region_name: str = "us-east-1"):
+    """Returns a shared S3 client, created once per region and reused for the life of the process
+
+    The client is configured with connection_utils.BOTO_CONFIG (keep-alive, a 64-connection pool
+    and adaptive retries). If you pass your own S3 resource or client to the functions in this
+    module instead, create it with config=BOTO_CONFIG to get the same connection reuse.
+
+    Parameters
+    ----------
+    region_name : str (optional), default = us-east-1
+        AWS region of the client
+
+    Returns
+    -------
+    boto3.client
+        an S3 client
+    """
+    from .connection_utils import get_aws_client
+
+    return get_aws_client("s3", region_name)
+
+
+def _client(s3_resource: ServiceResource | None):
+    """Returns the low-level client behind an S3 resource connection, or the shared client for None"""
+    if s3_resource is None:
+        return get_s3_client()
+
+    # A client's meta has no client attribute, so clients are passed through as-is
+    return getattr(s3_resource.meta, "client", s3_resource)
+
+
+def _raise_unless_missing_bucket(error: ClientError, bucket_name: str) -> None:
+    """Logs a failed bucket listing when the bucket doesn't exist, and re-raises any other error
+    (e.g. access denied or throttling) rather than reporting it as missing"""
+    if error.response["Error"]["Code"] != "NoSuchBucket":
+        log.error(f"Could not list S3 Bucket '{bucket_name}': {error}")
+        raise error
+
+    log.info(f"S3 Bucket '{bucket_name}' does not exist")
+
+
+# Key listings and the time they were fetched, keyed by (client, bucket_name, prefix). Clients hash
+# by identity, so listings made with one set of credentials are never served to another.
+_S3_KEYS_CACHE = {}
+S3_KEYS_CACHE_TTL = 60
+
+
+def list_s3_keys(
+    s3_resource: ServiceResource | None,
+    bucket_name: str,
+    prefix: str = "",
+    ttl: int = S3_KEYS_CACHE_TTL,
+) -> frozenset:
+    """Lists every key in an S3 bucket that starts with a prefix
+
+    Results are reused for ttl seconds per client, bucket and prefix, and cleared when this module
+    uploads a file, so changes made elsewhere show up once the listing expires.
+
+    Parameters
+    ----------
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
+
+    bucket_name : str
+        s3 bucket you would like to access
+
+    prefix : str, default = ""
+        only keys beginning with this prefix are returned
+
+    ttl : int, default = S3_KEYS_CACHE_TTL
+        number of seconds to reuse a cached listing. 0 always lists the bucket.
+
+    Returns
+    -------
+    frozenset
+        the keys in the bucket that begin with the prefix
+
+    """
+    client = _client(s3_resource)
+    key = (client, bucket_name, prefix)
+    if key in _S3_KEYS_CACHE:
+        keys, listed_at = _S3_KEYS_CACHE[key]
+        if time.monotonic() - listed_at < ttl:
+            return keys
+
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+    keys = frozenset(obj["Key"] for page in pages for obj in page.get("Contents", []))
+    _S3_KEYS_CACHE[key] = (keys, time.monotonic())
+
+    return keys
+
 
 def check_if_folder_exists_in_s3_bucket(
-    s3_resource: ServiceResource, bucket_name: str, directory: str
+    s3_resource: ServiceResource | None, bucket_name: str, directory: str
 ) -> bool:
     """Checks S3 bucket to determine if a folder exists in the bucket
 
     Parameters
     ----------
-    s3_resource : ServiceResource
-        an S3 resource connection
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
 
     bucket_name : str
         s3 bucket you would like to access
@@ -40,98 +156,191 @@ def check_if_folder_exists_in_s3_bucket(
     bool
         True, if the directory exists in the bucket, False otherwise.
 
+    Raises
+    ------
+    ClientError
+        if S3 returns an error other than the bucket not existing (e.g. access denied or throttling)
+
     """
 
     directory = ensure_file_slash(directory)
 
+    # One key is enough to prove the folder exists, whether as a marker or implied by a file in it
     try:
-        s3_resource.head_bucket(Bucket=bucket_name)
-        try:
-            s3_resource.Object(bucket_name=bucket_name, key=directory).load()
+        response = _client(s3_resource).list_objects_v2(
+            Bucket=bucket_name, Prefix=directory, MaxKeys=1
+        )
+        if response.get("KeyCount", 0) > 0:
             log.info(f"'{directory}' exists in S3 Bucket '{bucket_name}'")
             return True
-        except ClientError as e:
-            log.error(f"Error = {e}")
+        else:
             log.info(f"'{directory}' does not exist in S3 Bucket '{bucket_name}'")
             return False
-    except ClientError:
-        log.info(f"S3 Bucket '{bucket_name}' does not exist")
+    except ClientError as e:
+        _raise_unless_missing_bucket(e, bucket_name)
         return False
 
 
+def check_if_folders_exist_in_s3_bucket(
+    s3_resource: ServiceResource | None, bucket_name: str, directories: list
+) -> dict:
+    """Checks S3 bucket to determine which of several folders exist in the bucket
+
+    All the folders are checked against one fresh listing of their common prefix, rather than one
+    request per folder. Paging stops as soon as every folder has been found, and only the folders
+    asked about are kept in memory. Folders with no common prefix are checked against a listing of
+    the whole bucket.
+
+    Parameters
+    ----------
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
+
+    bucket_name : str
+        s3 bucket you would like to access
+
+    directories : list
+        the names of the directories you would like to determine if they exist in the bucket
+
+    Returns
+    -------
+    dict
+        a dictionary of each directory and whether it exists in the bucket
+
+    Raises
+    ------
+    ClientError
+        if S3 returns an error other than the bucket not existing (e.g. access denied or throttling)
+
+    """
+    prefixes = {directory: ensure_file_slash(directory) for directory in directories}
+    remaining = set(prefixes.values())
+    found = set()
+
+    paginator = _client(s3_resource).get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name, Prefix=os.path.commonprefix(list(remaining))
+    )
+    try:
+        for page in pages:
+            for obj in page.get("Contents", []):
+                # Every folder the key sits in, e.g. 'a/b/c.csv' -> 'a/', 'a/b/'
+                parts = obj["Key"].split("/")[:-1]
+                for i in range(1, len(parts) + 1):
+                    folder = "/".join(parts[:i]) + "/"
+                    if folder in remaining:
+                        remaining.discard(folder)
+                        found.add(folder)
+
+            if not remaining:
+                break
+    except ClientError as e:
+        _raise_unless_missing_bucket(e, bucket_name)
+        return dict.fromkeys(directories, False)
+
+    folders_exist = {}
+    for directory, prefix in prefixes.items():
+        folders_exist[directory] = prefix in found
+        if folders_exist[directory]:
+            log.info(f"'{prefix}' exists in S3 Bucket '{bucket_name}'")
+        else:
+            log.info(f"'{prefix}' does not exist in S3 Bucket '{bucket_name}'")
+
+    return folders_exist
+
+
 def check_if_file_exists_in_s3(
-    s3_resource: ServiceResource, bucket_name: str, filename: str, path: str = None
-) -> bool:
-    """Checks S3 bucket to determine if a file exists in a specific path in the bucket
+    s3_resource: ServiceResource | None,
+    bucket_name: str,
+    filename: str | list,
+    path: str = None,
+) -> bool | dict:
+    """Checks S3 bucket to determine if a file (or list of files) exists in a specific path in the bucket
 
     If the file you are searching for exists not in the root of the bucket, you need to include the path to the file.
+    A single filename is checked with one HEAD request. A list of filenames is checked against a single
+    listing of the path, rather than one request per file.
 
     Parameters
     ----------
-    s3_resource : ServiceResource
-        an S3 resource connection
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
 
     bucket_name : str
         s3 bucket you would like to access
 
-    filename : str
-        the name of the file you would like to determine if it exists in the bucket
+    filename : str or list
+        the name of the file (or a list of names) you would like to determine if it exists in the bucket
 
     path : str, default = None
         If the file you are searching for exists not in the root of the bucket, you need to include the path to the file
 
     Returns
     -------
-    bool
+    bool or dict
         True, if the file exists in the specified path/bucket, False otherwise.
+        If a list of filenames is passed, a dictionary of each filename and whether it exists.
 
-    """
+    Raises
+    ------
+    ClientError
+        if S3 returns an error other than the object not existing (e.g. access denied or throttling)
 
-    if filename_is_blank(filename):
-        return False
+    """
+    path = ensure_file_slash(path) if path else ""
 
-    if path is None:
-        try:
-            s3_resource.meta.client.head_bucket(Bucket=bucket_name)
-            try:
-                s3_resource.Object(bucket_name=bucket_name, key=filename).load()
-                log.info(f"'{filename}' exists in S3 Bucket '{bucket_name}'")
-                return True
-            except ClientError:
-                log.info(f"'{filename}' does not exist in S3 Bucket '{bucket_name}'")
-                return False
-        except ClientError:
-            log.info(f"S3 Bucket '{bucket_name}' does not exist")
+    if isinstance(filename, str):
+        if filename_is_blank(filename):
             return False
 
-    else:
         try:
-            check_if_folder_exists_in_s3_bucket(s3_resource, bucket_name, path)
-            path = ensure_file_slash(path)
-            file_path = path + filename
-            s3_resource.Object(bucket_name=bucket_name, key=file_path).load()
-            log.info(f"'{filename}' exists in directory '{path}'")
+            _client(s3_resource).head_object(Bucket=bucket_name, Key=path + filename)
+            log.info(f"'{filename}' exists in '{bucket_name}/{path}'")
             return True
-        except ClientError:
-            log.info(f"'{filename}' does not exist in directory '{path}'")
+        except ClientError as e:
+            # Only a missing object means False; access and throttling errors are raised
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                log.error(f"Could not check '{filename}' in '{bucket_name}': {e}")
+                raise
+
+            log.info(f"'{filename}' does not exist in '{bucket_name}/{path}'")
             return False
 
+    try:
+        keys = list_s3_keys(s3_resource, bucket_name, path)
+    except ClientError as e:
+        _raise_unless_missing_bucket(e, bucket_name)
+        return dict.fromkeys(filename, False)
+
+    files_exist = {}
+    for name in filename:
+        files_exist[name] = name != "" and path + name in keys
+        if files_exist[name]:
+            log.info(f"'{name}' exists in '{bucket_name}/{path}'")
+        else:
+            log.info(f"'{name}' does not exist in '{bucket_name}/{path}'")
+
+    return files_exist
+
 
 def move_local_file_to_s3(
-    s3_resource: ServiceResource,
+    s3_resource: ServiceResource | None,
     local_filename: str,
     local_path: str,
     bucket: str,
     region: str = "us-east-1",
     s3_filename: str = None,
     s3_path: str = None,
+    transfer_config: TransferConfig = DEFAULT_TRANSFER_CONFIG,
+    expires_in: int = 3600,
+    raise_on_error: bool = False,
 ):
     """Moves a local file to an S3 bucket
 
     Parameters
     ----------
-    s3_resource : ServiceResource
-        an S3 resource connection
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
 
     local_filename : str
         the name of the file you would like to move to S3
@@ -143,6 +352,7 @@ def move_local_file_to_s3(
         s3 bucket you would like to access
 
     region : str (optional), default = us-east-1
+        region of the bucket, used for the S3 console link that is logged
 
     s3_filename : str (optional), default = local_filename
         name you would like the file to have in S3
@@ -150,10 +360,19 @@ def move_local_file_to_s3(
     s3_path : str (optional), default = None
         path to the folder you would like to store the file in s3
 
+    transfer_config : TransferConfig (optional), default = DEFAULT_TRANSFER_CONFIG
+        multipart settings for the upload, used for files of SINGLE_PUT_THRESHOLD bytes or more
+
+    expires_in : int (optional), default = 3600
+        number of seconds the returned link stays valid
+
+    raise_on_error : bool (optional), default = False
+        whether to re-raise a failed upload after logging it, rather than returning None
+
     Returns
     -------
     str
-        returns a link to the file in s3
+        returns a presigned link to download the file from s3, or None if the upload failed
 
     """
 
@@ -161,6 +380,8 @@ def move_local_file_to_s3(
         s3_filename = local_filename
     try:
         local_filepath = check_if_file_exists(local_path, local_filename)
+        if not local_filepath:
+            return None
 
         if s3_path:
             s3_path = ensure_file_slash(s3_path)
@@ -168,23 +389,117 @@ def move_local_file_to_s3(
         else:
             s3_filepath = s3_filename
 
-        s3_resource.Bucket(bucket).upload_file(local_filepath, s3_filepath)
-        log.info(f"'{local_filename}' moved to '{s3_filepath}' in '{bucket}'")
-        return f"https://s3.console.aws.amazon.com/s3/object/{bucket}?region={region}&prefix={s3_filepath}"
-    except Exception as e:
-        print(f"{type(e)}: {e}")
+        # Small files go up in a single PUT, skipping the transfer manager's threads
+        size = os.path.getsize(local_filepath)
+        client = _client(s3_resource)
+        if size < SINGLE_PUT_THRESHOLD:
+            with open(local_filepath, "rb") as body:
+                client.put_object(
+                    Bucket=bucket, Key=s3_filepath, Body=body, ContentLength=size
+                )
+        else:
+            client.upload_file(
+                local_filepath, bucket, s3_filepath, Config=transfer_config
+            )
+        _S3_KEYS_CACHE.clear()
+        log.info(
+            f"'{local_filename}' moved to '{s3_filepath}' in '{bucket}': "
+            f"https://s3.console.aws.amazon.com/s3/object/{bucket}?region={region}&prefix={s3_filepath}"
+        )
+
+        # Signed locally, so this doesn't make another request to S3
+        return client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": s3_filepath},
+            ExpiresIn=expires_in,
+        )
+    except (ClientError, S3UploadFailedError, OSError):
+        log.exception(f"Could not move '{local_filename}' to '{bucket}'")
+        if raise_on_error:
+            raise
+        return None
+
+
+def move_local_files_to_s3(
+    s3_resource: ServiceResource | None,
+    bucket: str,
+    items: list,
+    region: str = "us-east-1",
+    max_workers: int = 16,
+    transfer_config: TransferConfig = BATCH_TRANSFER_CONFIG,
+    expires_in: int = 3600,
+    raise_on_error: bool = False,
+) -> list:
+    """Moves many local files to an S3 bucket, uploading them in parallel over one shared client
+
+    Parameters
+    ----------
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
+
+    bucket : str
+        s3 bucket you would like to access
+
+    items : list
+        (local_filename, local_path, s3_filename, s3_path) tuples, one per file, as they would be
+        passed to move_local_file_to_s3(). s3_filename and s3_path may be None.
+
+    region : str (optional), default = us-east-1
+
+    max_workers : int (optional), default = 16
+        the number of files to upload at once
+
+    transfer_config : TransferConfig (optional), default = BATCH_TRANSFER_CONFIG
+        multipart settings for each upload
+
+    expires_in : int (optional), default = 3600
+        number of seconds the returned links stay valid
+
+    raise_on_error : bool (optional), default = False
+        whether to re-raise the first failed upload after logging it, rather than returning None for it
+
+    Returns
+    -------
+    list
+        a presigned link to each file in s3, in the same order as items (None for any upload that failed)
+
+    """
+    client = _client(s3_resource)
+
+    def upload(item):
+        local_filename, local_path, s3_filename, s3_path = item
+        return move_local_file_to_s3(
+            client,
+            local_filename,
+            local_path,
+            bucket,
+            region=region,
+            s3_filename=s3_filename,
+            s3_path=s3_path,
+            transfer_config=transfer_config,
+            expires_in=expires_in,
+            raise_on_error=raise_on_error,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(upload, items))
 
 
 def create_directory_in_s3(
-    s3_resource: ServiceResource, bucket: str, folder_name: str
+    s3_resource: ServiceResource | None,
+    bucket: str,
+    folder_name: str,
+    create_marker: bool = False,
 ) -> None:
-    """Creates a directory in S3.
-    Due to the flat file structure of S3, this needs to be done separately from loading a file
+    """Deprecated: S3 has no directories, so there is nothing to create before loading a file.
+
+    A folder exists as soon as a file is uploaded under its path, and check_if_folder_exists_in_s3_bucket()
+    finds it without a marker. By default this does nothing but log a warning.
 
     Parameters
     ----------
-    s3_resource : ServiceResource
-        an S3 resource connection
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
 
     bucket : str
         s3 bucket you would like to access
@@ -192,30 +507,70 @@ def create_directory_in_s3(
     folder_name : str
         name of the directory (or full path) you would like to create in the s3 bucket
 
+    create_marker : bool (optional), default = False
+        whether to still write a zero-byte "folder/" marker object, for tools that only show
+        folders that have one
+
     Returns
     -------
     None
 
     """
     directory = ensure_file_slash(folder_name)
-    s3_resource.Bucket(bucket).put_object(Key=directory)
+
+    if not create_marker:
+        log.warning(
+            f"create_directory_in_s3 is deprecated; '{directory}' will exist once a file is loaded to it"
+        )
+        return
+
+    _client(s3_resource).put_object(Bucket=bucket, Key=directory)
+    _S3_KEYS_CACHE.clear()
+
+
+def _local_file_matches_s3(
+    client, bucket: str, s3_filepath: str, local_filepath: str
+) -> bool:
+    """Checks whether a local file already matches an S3 object, comparing the MD5 ETag of single-part
+    uploads and the size of multipart uploads, whose ETags aren't an MD5 of the file"""
+    try:
+        local_size = os.path.getsize(local_filepath)
+    except OSError:
+        return False
+
+    metadata = client.head_object(Bucket=bucket, Key=s3_filepath)
+    etag = metadata["ETag"].strip('"')
+
+    if "-" in etag:
+        return metadata["ContentLength"] == local_size
+
+    md5 = hashlib.md5()
+    with open(local_filepath, "rb") as local_file:
+        for chunk in iter(lambda: local_file.read(1024 * 1024), b""):
+            md5.update(chunk)
+
+    return md5.hexdigest() == etag
 
 
 def pull_file_from_s3(
-    s3_resource: ServiceResource,
+    s3_resource: ServiceResource | None,
     bucket: str,
     s3_filename: str,
     s3_path: str = None,
     local_path: str = None,
     local_filename: str = None,
+    transfer_config: TransferConfig = DEFAULT_TRANSFER_CONFIG,
+    skip_unchanged: bool = True,
+    raise_on_error: bool = False,
 ) -> bool:
-    """Creates a directory in S3.
-    Due to the flat file structure of S3, this needs to be done separately from loading a file
+    """Pulls a file from S3 to a local folder
+
+    If the file has already been pulled and is unchanged in S3, it isn't downloaded again.
 
     Parameters
     ----------
-    s3_resource : ServiceResource
-        an S3 resource connection
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
 
     bucket : str
         s3 bucket you would like to access
@@ -226,42 +581,136 @@ def pull_file_from_s3(
     s3_path : str (optional), default = None
         path to the folder you would like to retrieve the file from in s3
 
-    folder_name : str
-        name of the directory (or full path) you would like to create in the s3 bucket
-
     local_path : str (optional), default = same folder the file is being executed in
         the path to save the local file
 
     local_filename : str (optional), default = s3_filename
         the name of the file you would like save file as
 
+    transfer_config : TransferConfig (optional), default = DEFAULT_TRANSFER_CONFIG
+        multipart settings for the download
+
+    skip_unchanged : bool (optional), default = True
+        whether to skip the download when the local file already matches the file in S3
+
+    raise_on_error : bool (optional), default = False
+        whether to re-raise a failed download (including a missing file) after logging it, rather than returning False
+
     Returns
     -------
     bool
-        True if file moved successfully; else False
+        True if file moved successfully (or was already up to date); else False
     """
-    try:
-        if s3_path:
-            s3_path = ensure_file_slash(s3_path)
-            s3_filepath = s3_path + s3_filename
-        else:
-            s3_filepath = s3_filename
+    if filename_is_blank(s3_filename):
+        return False
 
-        if check_if_file_exists_in_s3(s3_resource, bucket, s3_filename, s3_path):
-            if not local_filename:
-                local_filename = s3_filename
+    if s3_path:
+        s3_path = ensure_file_slash(s3_path)
+        s3_filepath = s3_path + s3_filename
+    else:
+        s3_path = ""
+        s3_filepath = s3_filename
 
-            if not local_path:
-                local_path = os.path.dirname(os.path.realpath(__file__))
-        else:
-            return False
+    if not local_filename:
+        local_filename = s3_filename
+
+    if not local_path:
+        local_path = _MODULE_DIR
+
+    local_path = ensure_file_slash(local_path)
+    local_filepath = local_path + local_filename
+
+    # download_file() HEADs the object itself, so a missing file is caught from its error
+    # rather than checked for up front
+    try:
+        client = _client(s3_resource)
+        if skip_unchanged and _local_file_matches_s3(
+            client, bucket, s3_filepath, local_filepath
+        ):
+            log.info(f"'{local_filename}' in '{local_path}' is already up to date")
+            return True
 
-        local_path = ensure_file_slash(local_path)
-        local_filepath = local_path + local_filename
         make_dir_if_not_exists(local_path)
-        s3_resource.Bucket(bucket).download_file(s3_filepath, local_filepath)
+        client.download_file(
+            bucket, s3_filepath, local_filepath, Config=transfer_config
+        )
         log.info(f"'{local_filename}' moved to '{local_path}'")
         return True
-    except Exception as e:
-        print(f"{type(e)}: {e}")
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            log.info(f"'{s3_filename}' does not exist in '{bucket}/{s3_path}'")
+        else:
+            log.exception(f"Could not pull '{s3_filepath}' from '{bucket}'")
+        if raise_on_error:
+            raise
+        return False
+    except OSError:
+        log.exception(f"Could not pull '{s3_filepath}' from '{bucket}'")
+        if raise_on_error:
+            raise
         return False
+
+
+def pull_files_from_s3(
+    s3_resource: ServiceResource | None,
+    bucket: str,
+    s3_filenames: list,
+    s3_path: str = None,
+    local_path: str = None,
+    max_workers: int = 16,
+    transfer_config: TransferConfig = BATCH_TRANSFER_CONFIG,
+    raise_on_error: bool = False,
+):
+    """Pulls many files from S3 in parallel over one shared client, yielding each result as it finishes
+
+    A new download starts as soon as any one finishes, so a slow file doesn't hold up the rest.
+
+    Parameters
+    ----------
+    s3_resource : ServiceResource or None
+        an S3 resource connection or client; None uses the shared client from get_s3_client()
+
+    bucket : str
+        s3 bucket you would like to access
+
+    s3_filenames : list
+        names of the files you would like to pull from S3
+
+    s3_path : str (optional), default = None
+        path to the folder you would like to retrieve the files from in s3
+
+    local_path : str (optional), default = same folder the file is being executed in
+        the path to save the local files
+
+    max_workers : int (optional), default = 16
+        the number of files to download at once
+
+    transfer_config : TransferConfig (optional), default = BATCH_TRANSFER_CONFIG
+        multipart settings for each download
+
+    raise_on_error : bool (optional), default = False
+        whether to re-raise a failed download when its result is reached, rather than yielding False for it
+
+    Yields
+    ------
+    str, bool
+        the name of each file, and whether it was pulled successfully, in the order they finish
+    """
+    client = _client(s3_resource)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                pull_file_from_s3,
+                client,
+                bucket,
+                s3_filename,
+                s3_path,
+                local_path,
+                transfer_config=transfer_config,
+                raise_on_error=raise_on_error,
+            ): s3_filename
+            for s3_filename in s3_filenames
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
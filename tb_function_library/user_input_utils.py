@@ -1,8 +1,7 @@
 from __future__ import annotations
 import os
 from multiprocessing.connection import Connection
-from pyclbr import Function
-from pandas import DataFrame as DF
+from typing import Callable
 from .connection_utils import LastpassManager
 from .database_utils import check_if_schema_exists
 from .file_utils import check_if_file_exists
@@ -13,6 +12,9 @@ from .log_config import get_logger
 
 log = get_logger(__name__)
 
+# Responses to yes_true_else_false() that count as 'Yes'
+_YES = frozenset({"y", "yes", "true", "t", "1"})
+
 
 def yes_true_else_false(message: str) -> bool:
     """Function to be used in main for default behavior of user input (Y(es) = True, else False)
@@ -29,12 +31,7 @@ def yes_true_else_false(message: str) -> bool:
     """
     user_input = input(f"{message} (Y or Yes for 'Yes'): ")
 
-    if user_input.lower() in ("y", "yes", True, "true"):
-        user_input = True
-    else:
-        user_input = False
-
-    return user_input
+    return user_input.strip().lower() in _YES
 
 
 def enter_for_default(message: str, default: str) -> str:
@@ -79,25 +76,22 @@ def ensure_positive_int(message: str, default: int, zero_behavior) -> int:
     Returns
     -------
     int
-        Returns a positive integer selected by the user
+        Returns a positive integer selected by the user (or zero_behavior), or None if the prompt is interrupted
 
     """
     while True:
         try:
-            input = enter_for_default(message, default)
-
-            input = int(input)
-            if input < 0:
-                raise AssertionError
-            elif input == 0:
-                input = zero_behavior
-            break
+            response = str(enter_for_default(message, default)).strip()
         except KeyboardInterrupt:
-            break
-        except:
+            return None
+
+        # Only digits are accepted, so negative numbers are rejected along with non-numbers
+        if not response.isdecimal():
             print("That's not a positive integer. Please try again.")
+            continue
 
-    return input
+        number = int(response)
+        return zero_behavior if number == 0 else number
 
 
 def ensure_lastpass_entry_exists(lastpass_entry: str) -> LastpassManager:
@@ -126,7 +120,8 @@ def ensure_lastpass_entry_exists(lastpass_entry: str) -> LastpassManager:
             return lpass
         except KeyboardInterrupt:
             break
-        except:
+        except ValueError:
+            # LastpassManager raises ValueError when the entry can't be read; ask again
             pass
 
 
@@ -150,33 +145,30 @@ def ensure_schema_exists(schema: str, conn: Connection):
     while True:
         schema = enter_for_default("What is the schema?", schema)
 
+        # check_if_schema_exists() returns False, rather than a DataFrame, if the schema doesn't exist
         df_tables_in_schema = check_if_schema_exists(schema, conn)
-        try:
-            if not df_tables_in_schema.empty:
-                return schema, df_tables_in_schema
-        except:
-            pass
+        if df_tables_in_schema is not False:
+            return schema, df_tables_in_schema
 
 
-def ensure_not_blank(function: Function):
+def ensure_not_blank(function: Callable[[], str]) -> str:
     """A function that ENSURES an entry from the user is not blank.
 
     If the user entry is empty, it will continually loop and ask again until a entry is not empty
 
     Parameters
     ----------
-    schema : str
-        a schema name
-    conn : Connection
-        a database connection
+    function : Callable
+        a function, taking no arguments, that prompts the user and returns their entry,
+        e.g. lambda: input("What is the table name? ")
 
     Returns
     -------
-    str, DataFrame
-        returns the schema and a DataFrame of all the tables that exist in the schema.
+    str
+        returns the first entry that is not blank
     """
     while True:
-        response = function
+        response = function()
         if response != "":
             return response
 
@@ -201,16 +193,22 @@ def ensure_file_exists(file_name: str, directory_name: str, default_directory: s
         returns the filename, directory, and entire filepath to the file in question.
     """
 
+    listed_directory = None
     while True:
         directory = enter_for_default(directory_name, default_directory)
 
-        # Print all files in directory
-        dir_list = os.listdir(directory)
+        # Print all files in directory, only re-reading it when a different directory is entered
+        if directory != listed_directory:
+            with os.scandir(directory) as entries:
+                dir_list = sorted(
+                    entry.name for entry in entries if not entry.name.startswith(".")
+                )
+            listed_directory = directory
+
         if len(dir_list) != 0:
             print(f"Here are the files in {directory}:\n")
-            for file in sorted(dir_list):
-                if file[0] != ".":
-                    print(file)
+            for file in dir_list:
+                print(file)
             print("\n")
 
         filename = input(f"{file_name}: ")